@@ -2,36 +2,70 @@
 from __future__ import annotations
 
 import async_timeout
+import voluptuous as vol
 
+from collections import Counter
+from collections.abc import Callable
+from contextlib import nullcontext
 from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOGGER
+from .const import CONF_ADDITIONAL_HOSTS, CONF_RESTORE_AFTER_REBOOT, DOMAIN, LOGGER
 from jukeaudio.exceptions import AuthenticationException, UnexpectedException
-from .hub import JukeAudioHub
+from .capture import CaptureWriter
+from .hub import JukeAudioHub, JukeAudioSite, split_hosts
+from .profiling import JukeProfiler
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.MEDIA_PLAYER]
 
+SERVICE_START_RECORDING = "start_recording"
+SERVICE_STOP_RECORDING = "stop_recording"
+SERVICE_PROFILE = "profile"
+# A slug, so the capture always lands in the config directory
+START_RECORDING_SCHEMA = vol.Schema({vol.Optional("filename"): cv.slug})
+PROFILE_SCHEMA = vol.Schema(
+    {vol.Optional("refreshes", default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=100))}
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Juke Audio from a config entry."""
 
-    hub = JukeAudioHub(
-        hass,
-        entry.data[CONF_HOST],
-        entry.data[CONF_USERNAME],
-        entry.data[CONF_PASSWORD],
-    )
+    additional_hosts = split_hosts(entry.data.get(CONF_ADDITIONAL_HOSTS, ""))
+    restore_after_reboot = entry.data.get(CONF_RESTORE_AFTER_REBOOT, False)
+    if additional_hosts:
+        hub = JukeAudioSite(
+            hass,
+            [entry.data[CONF_HOST], *additional_hosts],
+            entry.data[CONF_USERNAME],
+            entry.data[CONF_PASSWORD],
+            restore_after_reboot,
+        )
+    else:
+        hub = JukeAudioHub(
+            hass,
+            entry.data[CONF_HOST],
+            entry.data[CONF_USERNAME],
+            entry.data[CONF_PASSWORD],
+            restore_after_reboot,
+        )
 
     if not await hub.verify_connection():
         return False
 
     await hub.initialize()
 
+    # Entries created before unique IDs were set are matched by server device ID
+    if entry.unique_id is None and hub.server_device_id is not None:
+        hass.config_entries.async_update_entry(entry, unique_id=hub.server_device_id)
+
     coordinator = JukeUpdateCoordinator(hass, hub, entry.data[CONF_SCAN_INTERVAL] if CONF_SCAN_INTERVAL in entry.data else 30)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {"hub": hub, "coordinator": coordinator}
@@ -39,21 +73,99 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Entities are added now, so later polls only cover what they subscribed to
+    coordinator.track_subscriptions = True
+
+    _async_register_services(hass)
+
     return True
 
 
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the capture services once for all entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_START_RECORDING):
+        return
+
+    async def async_start_recording(call: ServiceCall) -> None:
+        """Record all client traffic of every entry to the config directory."""
+        await async_stop_recording(call)
+        timestamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+        for entry_id, data in hass.data[DOMAIN].items():
+            filename = call.data.get("filename", f"jukeaudio_capture_{timestamp}")
+            recorder = CaptureWriter(hass, hass.config.path(f"{filename}_{entry_id}.jsonl.gz"))
+            await recorder.async_start()
+            data["hub"].start_recording(recorder)
+            data["recorder"] = recorder
+            LOGGER.info("Recording Juke traffic to %s", recorder.path)
+
+    async def async_stop_recording(call: ServiceCall) -> None:
+        """Stop recording and close the capture files."""
+        for data in hass.data[DOMAIN].values():
+            if (recorder := data.pop("recorder", None)) is not None:
+                data["hub"].stop_recording()
+                await recorder.async_stop()
+                LOGGER.info("Stopped recording Juke traffic to %s", recorder.path)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_RECORDING, async_start_recording, schema=START_RECORDING_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_STOP_RECORDING, async_stop_recording)
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next refreshes and commands of every entry."""
+        entries = hass.data[DOMAIN]
+        coordinators = [data["coordinator"] for data in entries.values()]
+        if not coordinators:
+            return
+        if any(coordinator.profiler is not None for coordinator in coordinators):
+            LOGGER.warning("Juke profiling is already running")
+            return
+
+        @callback
+        def done() -> None:
+            for coordinator in coordinators:
+                coordinator.profiler = None
+
+        # Only one profiler can be active at a time, so all entries share it
+        name = next(iter(entries)) if len(entries) == 1 else "all"
+        refreshes = call.data["refreshes"] * len(coordinators)
+        LOGGER.info("Profiling the next %s Juke refreshes", refreshes)
+        profiler = JukeProfiler(hass, name, refreshes, done)
+        for coordinator in coordinators:
+            coordinator.profiler = profiler
+
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        if (recorder := data.get("recorder")) is not None:
+            data["hub"].stop_recording()
+            await recorder.async_stop()
 
     return unload_ok
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: DeviceEntry
+) -> bool:
+    """Allow removing an amp that is no longer reported."""
+    hub = hass.data[DOMAIN][entry.entry_id]["hub"]
+    for device_id, juke in list(hub.jukes.items()):
+        if (DOMAIN, juke.uid_base) in device_entry.identifiers:
+            if juke.available:
+                return False
+            hub.remove_device(device_id)
+    return True
+
+
 class JukeUpdateCoordinator(DataUpdateCoordinator):
     """Juke data update coordinator."""
 
-    def __init__(self, hass: HomeAssistant, hub: JukeAudioHub, update_interval: int) -> None:
+    def __init__(self, hass: HomeAssistant, hub: JukeAudioHub | JukeAudioSite, update_interval: int) -> None:
         """Initialize my coordinator."""
         super().__init__(
             hass,
@@ -65,6 +177,41 @@ class JukeUpdateCoordinator(DataUpdateCoordinator):
         )
         LOGGER.debug("Juke data update interval: %s seconds", update_interval)
         self._hub = hub
+        self._subscriptions: Counter[tuple] = Counter()
+        self.track_subscriptions = False
+        self.profiler: JukeProfiler | None = None
+
+    def profile(self, kind: str):
+        """Context manager profiling a refresh or command while profiling is on."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.section(kind)
+
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        """Refresh data and notify entities, profiled when requested."""
+        with self.profile("refresh"):
+            await super()._async_refresh(*args, **kwargs)
+
+    @callback
+    def async_subscribe(self, kind: str, key: str | None = None) -> Callable[[], None]:
+        """Register that an enabled entity needs data of kind ("zone" or "inputs")."""
+        subscription = (kind, key)
+        self._subscriptions[subscription] += 1
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscriptions[subscription] -= 1
+            if self._subscriptions[subscription] <= 0:
+                del self._subscriptions[subscription]
+
+        return unsubscribe
+
+    def _requested_data(self) -> tuple[set[str] | None, bool]:
+        """Return the zone IDs and whether inputs are needed for the next poll."""
+        if not self.track_subscriptions:
+            return None, True
+        zone_ids = {key for kind, key in self._subscriptions if kind == "zone"}
+        return zone_ids, ("inputs", None) in self._subscriptions
 
     async def _async_update_data(self):
         """Fetch data from API endpoint.
@@ -76,7 +223,8 @@ class JukeUpdateCoordinator(DataUpdateCoordinator):
             # Note: asyncio.TimeoutError and aiohttp.ClientError are already
             # handled by the data update coordinator.
             async with async_timeout.timeout(60):
-                return await self._hub.fetch_data()
+                zone_ids, inputs = self._requested_data()
+                return await self._hub.fetch_data(zone_ids, inputs)
         except AuthenticationException as err:
             # Raising ConfigEntryAuthFailed will cancel future updates
             # and start a config flow with SOURCE_REAUTH (async_step_reauth)
@@ -0,0 +1,62 @@
+"""Cache for rarely changing Juke Audio reads"""
+from __future__ import annotations
+
+import time
+
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """Size bounded cache whose entries expire after ttl seconds
+
+    When full, the least recently used entry is evicted. The generation
+    changes on every invalidation, so a value read before one can be told
+    apart from a value read after it.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) is not None
+
+    def _lookup(self, key) -> tuple[float, Any] | None:
+        """Return the live entry for key, dropping it if expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key, default=None):
+        """Return the cached value for key or default"""
+        entry = self._lookup(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key, value) -> None:
+        """Store value for key"""
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys) -> None:
+        """Drop the given keys"""
+        self.generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self.generation += 1
+        self._entries.clear()
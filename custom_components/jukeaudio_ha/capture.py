@@ -0,0 +1,204 @@
+"""Record and replay of Juke Audio client traffic
+
+A capture is a JSON lines file, gzip compressed when the name ends in .gz.
+Each line records one client call:
+
+    {"t": start offset, "m": method, "a": args, "d": latency, "r": result}
+
+with "e": [exception class, message] instead of "r" when the call failed.
+Usernames and passwords are never written. Serial numbers, SSIDs and MAC
+addresses in responses are replaced by pseudonyms that are stable within
+one capture, so a replay still tells the amps apart.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import time
+
+from collections import defaultdict, deque
+from typing import Any
+
+from jukeaudio import exceptions
+from jukeaudio.jukeaudio_v3 import JukeAudioClientV3
+
+from .const import LOGGER, TO_REDACT
+
+REDACTED = "**REDACTED**"
+CREDENTIAL_ARGS = ("username", "password")
+
+
+def _open(path: str, mode: str):
+    """Open a capture file, compressed when it ends in .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _redact(method: str, args: tuple) -> list:
+    """Return the call arguments with credentials removed"""
+    params = list(inspect.signature(getattr(JukeAudioClientV3, method)).parameters)[1:]
+    return [
+        REDACTED if index < len(params) and params[index] in CREDENTIAL_ARGS else arg
+        for index, arg in enumerate(args)
+    ]
+
+
+def _redact_result(value: Any, key: bytes) -> Any:
+    """Return a response with the values of redacted keys pseudonymized"""
+    if isinstance(value, dict):
+        return {
+            name: _pseudonym(item, key) if name in TO_REDACT else _redact_result(item, key)
+            for name, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_result(item, key) for item in value]
+    return value
+
+
+def _pseudonym(value: Any, key: bytes) -> str | None:
+    """Replace a value by a keyed hash of it"""
+    if value is None:
+        return None
+    digest = hashlib.blake2s(str(value).encode(), key=key, digest_size=4).hexdigest()
+    return f"{REDACTED}{digest}"
+
+
+class CaptureWriter:
+    """Streams capture records to a file from a single writer task"""
+
+    def __init__(self, hass, path: str) -> None:
+        self._hass = hass
+        self.path = path
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._started = time.monotonic()
+        self._file = None
+        self._task = None
+        # Random per capture, so pseudonyms cannot be matched across files
+        self._redact_key = os.urandom(16)
+
+    async def async_start(self) -> None:
+        """Open the file and start writing"""
+        self._file = await self._hass.async_add_executor_job(_open, self.path, "w")
+        self._task = self._hass.async_create_background_task(
+            self._async_write(), "jukeaudio_ha capture writer"
+        )
+
+    async def async_stop(self) -> None:
+        """Flush pending records and close the file"""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+
+    def record(self, method: str, args: tuple, started: float, latency: float, result=None, error=None) -> None:
+        """Queue a record for a finished call"""
+        record: dict[str, Any] = {
+            "t": round(started - self._started, 4),
+            "m": method,
+            "a": _redact(method, args),
+            "d": round(latency, 4),
+        }
+        if error is not None:
+            record["e"] = [type(error).__name__, str(error)]
+        else:
+            record["r"] = _redact_result(result, self._redact_key)
+        self._queue.put_nowait(json.dumps(record, separators=(",", ":"), default=str))
+
+    async def _async_write(self) -> None:
+        """Write queued records in order"""
+        try:
+            while (line := await self._queue.get()) is not None:
+                lines = [line]
+                while not self._queue.empty():
+                    if (line := self._queue.get_nowait()) is None:
+                        self._queue.put_nowait(None)
+                        break
+                    lines.append(line)
+                await self._hass.async_add_executor_job(
+                    self._file.write, "\n".join(lines) + "\n"
+                )
+        finally:
+            await self._hass.async_add_executor_job(self._file.close)
+
+
+class RecordingClient:
+    """Client wrapper that records every call made through it"""
+
+    def __init__(self, client: JukeAudioClientV3, writer: CaptureWriter) -> None:
+        self.client = client
+        self._writer = writer
+
+    def __getattr__(self, method: str):
+        call = getattr(self.client, method)
+        if not inspect.iscoroutinefunction(call):
+            return call
+
+        async def record(*args):
+            started = time.monotonic()
+            try:
+                result = await call(*args)
+            except Exception as exc:
+                self._writer.record(method, args, started, time.monotonic() - started, error=exc)
+                raise
+            self._writer.record(method, args, started, time.monotonic() - started, result=result)
+            return result
+
+        return record
+
+
+class ReplayClient:
+    """Client that answers calls from a capture instead of an amp
+
+    Calls are matched on method and arguments, in recorded order. With
+    realtime set, each call returns when it returned in the capture,
+    counted from the first replayed call, so the caller is held to the
+    recorded polling rate and concurrency.
+    """
+
+    def __init__(self, records: list[dict], realtime: bool = False) -> None:
+        self._realtime = realtime
+        self._records: dict[tuple, deque[dict]] = defaultdict(deque)
+        for record in records:
+            self._records[self._key(record["m"], record["a"])].append(record)
+        self._first_offset = min((record["t"] for record in records), default=0)
+        self._started: float | None = None
+        # Host of the first recorded call, to point a hub at
+        self.host = next((record["a"][0] for record in records if record["a"]), None)
+
+    @classmethod
+    def load(cls, path: str, realtime: bool = False) -> ReplayClient:
+        """Read a capture file; do not call from the event loop"""
+        with _open(path, "r") as file:
+            return cls([json.loads(line) for line in file if line.strip()], realtime)
+
+    @staticmethod
+    def _key(method: str, args: list) -> tuple:
+        return (method, json.dumps(args, default=str))
+
+    def __getattr__(self, method: str):
+        if not hasattr(JukeAudioClientV3, method):
+            raise AttributeError(method)
+
+        async def replay(*args):
+            records = self._records.get(self._key(method, _redact(method, args)))
+            if not records:
+                raise exceptions.UnexpectedException(f"No recorded response for {method}{tuple(args)}")
+            # Keep the last response so polling can continue past the capture
+            record = records.popleft() if len(records) > 1 else records[0]
+            if self._realtime:
+                if self._started is None:
+                    self._started = time.monotonic()
+                finished = self._started + record["t"] - self._first_offset + record["d"]
+                await asyncio.sleep(max(0, finished - time.monotonic()))
+            if "e" in record:
+                name, message = record["e"]
+                LOGGER.debug("Replaying %s error for %s", name, method)
+                raise getattr(exceptions, name, exceptions.UnexpectedException)(message)
+            return record["r"]
+
+        return replay
@@ -13,24 +13,44 @@ from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD,CONF_SCA
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import DOMAIN, LOGGER
-from .hub import JukeAudioHub
+from .const import CONF_ADDITIONAL_HOSTS, CONF_RESTORE_AFTER_REBOOT, DOMAIN, LOGGER
+from .discovery import async_probe_hosts, subnet_hosts
+from .hub import JukeAudioHub, split_hosts
 from jukeaudio.exceptions import AuthenticationException, UnexpectedException
 
-# TODO adjust the data schema to the data that you need
-STEP_USER_DATA_SCHEMA = vol.Schema(
+CONF_SUBNET = "subnet"
+
+STEP_SCAN_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_HOST, default="juke.local"): str,
-        vol.Required(CONF_USERNAME, default="Admin"): str,
-        vol.Required(CONF_PASSWORD): str,
-        vol.Required(CONF_SCAN_INTERVAL, default=30): int
+        vol.Required(CONF_SUBNET): str,
     }
 )
 
 
+def user_data_schema(host: str = "juke.local") -> vol.Schema:
+    """Return the connection schema with the given default host."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_HOST, default=host): str,
+            vol.Required(CONF_USERNAME, default="Admin"): str,
+            vol.Required(CONF_PASSWORD): str,
+            vol.Required(CONF_SCAN_INTERVAL, default=30): int,
+            vol.Optional(CONF_ADDITIONAL_HOSTS, default=""): str,
+            vol.Optional(CONF_RESTORE_AFTER_REBOOT, default=False): bool,
+        }
+    )
+
+
+STEP_USER_DATA_SCHEMA = user_data_schema()
+
+
 def host_valid(host):
     """Return True if hostname or IP address is valid."""
+    host, _, port = host.partition(":")
+    if port and not port.isdigit():
+        return False
     try:
         if ipaddress.ip_address(host).version == (4 or 6):
             return True
@@ -51,13 +71,21 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]):
         except ValueError:
             raise InvalidUpdateInterval(ValueError)
 
+    additional_hosts = split_hosts(data.get(CONF_ADDITIONAL_HOSTS, ""))
+    if not all(host_valid(host) for host in additional_hosts):
+        raise CannotConnect
+    if len(await async_probe_hosts(additional_hosts)) != len(additional_hosts):
+        raise CannotConnect
+
     hub = JukeAudioHub(hass, data[CONF_HOST], data[CONF_USERNAME], data[CONF_PASSWORD])
 
     if not await hub.verify_connection():
         raise CannotConnect
 
     LOGGER.debug("Successfully reached the Juke amplifier on the network")
-    return await hub.get_devices()
+    devices = await hub.get_devices()
+    await hub.initialize()
+    return devices, hub.server_device_id
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -65,14 +93,97 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._host: str | None = None
+        self._discovered_hosts: list[str] = []
+        self._probe_cache: dict[str, bool] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_zeroconf(
+        self, discovery_info: ZeroconfServiceInfo
+    ) -> FlowResult:
+        """Handle a Juke server discovered via zeroconf."""
+        host = discovery_info.host
+        hostname = discovery_info.hostname.rstrip(".")
+        if discovery_info.port and discovery_info.port != 80:
+            host = f"{host}:{discovery_info.port}"
+            hostname = f"{hostname}:{discovery_info.port}"
+
+        # Only match data that needs no credentials; the server device ID
+        # becomes the unique ID once the user has entered them
+        if self._async_host_configured({host, hostname}):
+            return self.async_abort(reason="already_configured")
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+
+        if host not in await async_probe_hosts([host], self._probe_cache):
+            return self.async_abort(reason="cannot_connect")
+
+        self._host = host
+        self.context["title_placeholders"] = {"host": host}
+        return await self.async_step_manual()
+
+    def _async_host_configured(self, hosts: set[str]) -> bool:
+        """Return True if a configured entry already polls one of hosts."""
+        for entry in self._async_current_entries(include_ignore=False):
+            configured = {
+                entry.data.get(CONF_HOST),
+                *split_hosts(entry.data.get(CONF_ADDITIONAL_HOSTS, "")),
+            }
+            if hosts & configured:
+                return True
+        return False
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Probe a subnet for Juke servers."""
         errors: dict[str, str] = {}
         if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
+                hosts = subnet_hosts(user_input[CONF_SUBNET])
+            except ValueError:
+                errors["base"] = "invalid_subnet"
+            else:
+                self._discovered_hosts = await async_probe_hosts(hosts, self._probe_cache)
+                LOGGER.debug("Discovered Juke servers: %s", self._discovered_hosts)
+                if self._discovered_hosts:
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan", data_schema=STEP_SCAN_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick one of the discovered Juke servers."""
+        if user_input is not None:
+            self._host = user_input[CONF_HOST]
+            return await self.async_step_manual()
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_HOST): vol.In(self._discovered_hosts)}
+            ),
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the connection details."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                info, server_device_id = await validate_input(self.hass, user_input)
             except CannotConnect:
                 LOGGER.exception("Failed to reach Juke amplifier on the network")
                 errors["base"] = "cannot_connect"
@@ -86,11 +197,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
+                if server_device_id:
+                    # Replaces the host a zeroconf discovery was keyed on
+                    await self.async_set_unique_id(server_device_id)
+                    self._abort_if_unique_id_configured()
                 LOGGER.debug("Juke devices: %s. Registering with %s", info, info[0])
                 return self.async_create_entry(title=info[0], data=user_input)
 
+        data_schema = STEP_USER_DATA_SCHEMA
+        if self._host is not None:
+            data_schema = user_data_schema(self._host)
+
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=data_schema, errors=errors
         )
 
     async def async_step_reauth(self, user_input: dict[str, Any]) -> FlowResult:
@@ -1,5 +1,40 @@
 """Constants for the Juke Audio integration."""
 from logging import Logger, getLogger
 
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+
 DOMAIN = "jukeaudio_ha"
 LOGGER: Logger = getLogger(__package__)
+
+# Keys removed from diagnostics and captures
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, "serial_number", "ssid", "mac"}
+
+# Number of poll samples kept per amp for rolling health statistics
+ROLLING_WINDOW_SIZE = 120
+
+# Subnet discovery in the config flow
+DISCOVERY_PROBE_TIMEOUT = 2
+DISCOVERY_PROBE_CONCURRENCY = 32
+DISCOVERY_MAX_HOSTS = 1024
+
+# Maximum number of Juke servers polled at the same time by one hub
+MULTI_SERVER_CONCURRENCY = 4
+CONF_ADDITIONAL_HOSTS = "additional_hosts"
+
+# Cache for reads that only change on configuration changes or reboots
+CACHE_TTL = 600
+CACHE_MAX_SIZE = 256
+
+# Poll zones one by one when no more than this many are in use
+PER_ZONE_READ_LIMIT = 2
+
+# Device topology (config, attributes, device list) is only processed again
+# after a reboot, a firmware change, a new device, zone or input, and at
+# least this often. The devices info is still downloaded on every poll, so
+# this saves processing, not network traffic
+TOPOLOGY_REFRESH_INTERVAL = 3600
+CONF_RESTORE_AFTER_REBOOT = "restore_after_reboot"
+
+# On-demand profiling
+PROFILE_TIMEOUT = 600
+PROFILE_REPORT_LINES = 60
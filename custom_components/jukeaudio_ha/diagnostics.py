@@ -0,0 +1,26 @@
+"""Diagnostics support for Juke Audio"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, TO_REDACT
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    The hub only keeps the zones, inputs and device fields its entities use,
+    so the full payloads are fetched again here.
+    """
+    hub = hass.data[DOMAIN][entry.entry_id]["hub"]
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "data": async_redact_data(await hub.get_raw_data(), TO_REDACT),
+    }
@@ -0,0 +1,94 @@
+"""Discovery helpers for Juke Audio"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+
+import async_timeout
+
+from collections.abc import Iterable
+from contextvars import ContextVar
+
+from jukeaudio.jukeaudio_v3 import JukeAudioClientV3
+
+from .const import (
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_PROBE_CONCURRENCY,
+    DISCOVERY_PROBE_TIMEOUT,
+    LOGGER,
+)
+
+# Set in the task running a probe, so only the probe's own log records
+# are dropped and errors from polls running meanwhile still show
+_probing: ContextVar[bool] = ContextVar("jukeaudio_ha_probing", default=False)
+
+
+class _ProbeLogFilter(logging.Filter):
+    """Drop client log records emitted while probing
+
+    The client logs an error for every host that refuses the connection.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not _probing.get()
+
+
+logging.getLogger("jukeaudio.jukeaudio_v3").addFilter(_ProbeLogFilter())
+
+
+def subnet_hosts(subnet: str) -> list[str]:
+    """Return the host addresses of a subnet such as 192.168.1.0/24"""
+    network = ipaddress.ip_network(subnet.strip(), strict=False)
+    if network.num_addresses > DISCOVERY_MAX_HOSTS:
+        raise ValueError(f"Subnet {network} is larger than {DISCOVERY_MAX_HOSTS} addresses")
+    if network.num_addresses == 1:
+        return [str(network.network_address)]
+    return [str(host) for host in network.hosts()]
+
+
+async def async_probe_host(
+    client: JukeAudioClientV3, host: str, timeout: float = DISCOVERY_PROBE_TIMEOUT
+) -> bool:
+    """Return True if a compatible Juke server answers on host"""
+    token = _probing.set(True)
+    try:
+        async with async_timeout.timeout(timeout):
+            found = bool(await client.can_connect_to_juke(host))
+    except asyncio.TimeoutError:
+        found = False
+    finally:
+        _probing.reset(token)
+    if not found:
+        LOGGER.debug("No Juke server answered on %s", host)
+    return found
+
+
+async def async_probe_hosts(
+    hosts: Iterable[str],
+    cache: dict[str, bool] | None = None,
+    concurrency: int = DISCOVERY_PROBE_CONCURRENCY,
+    timeout: float = DISCOVERY_PROBE_TIMEOUT,
+) -> list[str]:
+    """Probe hosts concurrently and return the ones running a Juke server.
+
+    Results are stored in cache so hosts already probed in the same flow
+    are not contacted again.
+    """
+    if cache is None:
+        cache = {}
+
+    client = JukeAudioClientV3()
+    semaphore = asyncio.Semaphore(concurrency)
+    hosts = list(dict.fromkeys(hosts))
+    pending = [host for host in hosts if host not in cache]
+
+    async def probe(host: str) -> None:
+        async with semaphore:
+            cache[host] = await async_probe_host(client, host, timeout)
+
+    if pending:
+        LOGGER.debug("Probing %s hosts for Juke servers", len(pending))
+        await asyncio.gather(*(probe(host) for host in pending))
+
+    return [host for host in hosts if cache[host]]
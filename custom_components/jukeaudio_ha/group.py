@@ -0,0 +1,83 @@
+"""Aggregate state of the zones of a Juke Audio amp"""
+from __future__ import annotations
+
+from collections import Counter
+
+
+class ZoneGroup:
+    """Group state kept up to date from per-zone changes
+
+    Each update replaces one zone's contribution to the running totals, so
+    the group state costs O(1) per changed zone instead of a pass over all
+    zones whenever it is read.
+    """
+
+    def __init__(self) -> None:
+        self._zones: dict[str, tuple[bool, bool, int, tuple]] = {}
+        self._playing = 0
+        self._enabled = 0
+        self._volume_total = 0
+        self._sources: Counter[tuple] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    @property
+    def zone_ids(self) -> list[str]:
+        """IDs of the zones in the group"""
+        return list(self._zones)
+
+    def update(self, zone: dict) -> None:
+        """Apply the latest state of a zone"""
+        state = (
+            zone.get("active_input") is not None,
+            bool(zone.get("enabled", True)),
+            int(zone.get("volume") or 0),
+            tuple(zone.get("input") or ()),
+        )
+        previous = self._zones.get(zone["zone_id"])
+        if previous == state:
+            return
+        if previous is not None:
+            self._apply(previous, -1)
+        self._zones[zone["zone_id"]] = state
+        self._apply(state, 1)
+
+    def remove(self, zone_id: str) -> None:
+        """Drop a zone that is no longer reported"""
+        previous = self._zones.pop(zone_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+
+    def _apply(self, state: tuple[bool, bool, int, tuple], sign: int) -> None:
+        playing, enabled, volume, source = state
+        self._playing += sign * playing
+        self._enabled += sign * enabled
+        self._volume_total += sign * volume
+        self._sources[source] += sign
+        if not self._sources[source]:
+            del self._sources[source]
+
+    @property
+    def playing(self) -> bool:
+        """True when any zone is playing"""
+        return self._playing > 0
+
+    @property
+    def enabled(self) -> bool:
+        """True when any zone is enabled"""
+        return self._enabled > 0
+
+    @property
+    def volume(self) -> float | None:
+        """Mean zone volume, 0-100"""
+        if not self._zones:
+            return None
+        return self._volume_total / len(self._zones)
+
+    @property
+    def source(self) -> tuple | None:
+        """Input IDs shared by all zones, None when they differ"""
+        if len(self._sources) != 1:
+            return None
+        return next(iter(self._sources))
@@ -1,10 +1,42 @@
 """Hub for Juke Audio"""
+import asyncio
+import time
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
+from jukeaudio.exceptions import UnexpectedException
 from jukeaudio.jukeaudio_v3 import JukeAudioClientV3
 
-from .const import DOMAIN, LOGGER
+from .cache import TTLCache
+from .capture import CaptureWriter, RecordingClient
+from .const import (
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    DOMAIN,
+    LOGGER,
+    MULTI_SERVER_CONCURRENCY,
+    PER_ZONE_READ_LIMIT,
+    ROLLING_WINDOW_SIZE,
+    TOPOLOGY_REFRESH_INTERVAL,
+)
+from .group import ZoneGroup
+from .parsing import (
+    DEVICE_ATTRIBUTES_FIELDS,
+    DEVICE_CONFIG_FIELDS,
+    device_id_of,
+    project,
+    zone_from_config,
+)
+from .rolling import RollingStatistics
+
+# Server device IDs outlive a hub, so reloading an entry does not fetch them again
+_SERVER_DEVICE_IDS = TTLCache(CACHE_MAX_SIZE, CACHE_TTL)
+
+
+def split_hosts(hosts: str) -> list[str]:
+    """Split a comma or whitespace separated list of hosts"""
+    return [host for host in hosts.replace(",", " ").split() if host]
 
 
 class JukeAudioHub:
@@ -16,170 +48,630 @@ class JukeAudioHub:
         ip_address: str,
         username: str,
         password: str,
+        restore_after_reboot: bool = False,
     ) -> None:
         self._hass = hass
         self._ip_address = ip_address
         self._username = username
         self._password = password
+        self._restore_after_reboot = restore_after_reboot
         self.jukes = {}
         self.client = None
         self._server_device_id = None
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._cache = TTLCache(CACHE_MAX_SIZE, CACHE_TTL)
+        self._recorder: CaptureWriter | None = None
+        self._topology_synced: float | None = None
+        self._zone_ids: set[str] = set()
+        self._input_ids: set[str] = set()
+        self._commanded: dict[str, dict] = {}
+        # Cleared when the amp's zone config turns out not to carry zone state
+        self._per_zone_reads = True
+
+    async def _single_flight(self, key: tuple, request):
+        """Share one in-flight request between concurrent callers of key"""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(request())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            LOGGER.debug("Joining in-flight Juke request %s", key)
+        # Shield so a cancelled caller does not cancel the request for others
+        return await asyncio.shield(future)
+
+    async def _cached(self, key: tuple, request):
+        """Return the cached value of key, requesting it on a miss"""
+        value = self._cache.get(key)
+        if value is None:
+            generation = self._cache.generation
+            value = await request()
+            # A command may have invalidated the cache while the read was in
+            # flight, so the value could predate it
+            if self._cache.generation == generation:
+                self._cache.set(key, value)
+        return value
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached reads, e.g. after the amp rebooted"""
+        LOGGER.debug("Clearing Juke read cache for %s", self._ip_address)
+        self._cache.clear()
+        _SERVER_DEVICE_IDS.invalidate(self._ip_address)
 
     async def verify_connection(self) -> bool:
         """Test if we can connect to the host."""
         client = JukeAudioClientV3()
+        if self._recorder is not None:
+            client = RecordingClient(client, self._recorder)
         if await client.can_connect_to_juke(self._ip_address):
             self.client = client
             return True
         else:
             return False
 
+    def start_recording(self, recorder: CaptureWriter) -> None:
+        """Record all client calls to recorder"""
+        self.stop_recording()
+        self._recorder = recorder
+        if self.client is not None:
+            self.client = RecordingClient(self.client, recorder)
+
+    def stop_recording(self) -> None:
+        """Stop recording client calls"""
+        self._recorder = None
+        if isinstance(self.client, RecordingClient):
+            self.client = self.client.client
+
     async def get_devices(self):
         """Test if we can authenticate to the host."""
         return await self.client.get_devices(self._ip_address, self._username, self._password)
 
     async def initialize(self):
         """Initialize hub"""
-        self._server_device_id = await self.client.get_server_device_id(
-            self._ip_address, self._username, self._password)
+        self._server_device_id = _SERVER_DEVICE_IDS.get(self._ip_address)
+        if self._server_device_id is None:
+            self._server_device_id = await self.client.get_server_device_id(
+                self._ip_address, self._username, self._password)
+            _SERVER_DEVICE_IDS.set(self._ip_address, self._server_device_id)
+
+    @property
+    def host(self) -> str:
+        """Address of the Juke server"""
+        return self._ip_address
+
+    @property
+    def server_device_id(self) -> str | None:
+        """Device ID of the Juke server"""
+        return self._server_device_id
 
     async def get_connection_info(self):
         """Get connection info"""
-        return await self.client.get_device_connection_info(
-            self._ip_address, self._username, self._password, self._server_device_id
+        return await self._single_flight(
+            ("connection_info", self._server_device_id),
+            lambda: self.client.get_device_connection_info(
+                self._ip_address, self._username, self._password, self._server_device_id
+            ),
         )
 
     async def _get_devices_info(self):
         """Get devices info"""
-        return await self.client.get_devices_info(
-            self._ip_address, self._username, self._password
+        return await self._single_flight(
+            ("devices_info",),
+            lambda: self.client.get_devices_info(
+                self._ip_address, self._username, self._password
+            ),
         )
 
     async def _get_zones_ids(self):
         """Get zones"""
-        zones = await self.client.get_zones(self._ip_address, self._username, self._password)
+        zones = await self._cached(
+            ("zone_ids",),
+            lambda: self.client.get_zones(self._ip_address, self._username, self._password),
+        )
         return zones["zone_ids"]
     
     async def _get_zones_info(self):
         """Get zones"""
-        zones = await self.client.get_zones_info(self._ip_address, self._username, self._password)
-        return zones
+        return await self._single_flight(
+            ("zones_info",),
+            lambda: self.client.get_zones_info(self._ip_address, self._username, self._password),
+        )
 
-    async def _get_zone_config(self, zone_id: str):
+    async def _get_zone_config(self, zone_id: str, refresh: bool = False):
         """Get zone config"""
-        return await self.client.get_zone_config(
-            self._ip_address, self._username, self._password, zone_id
+        key = ("zone_config", zone_id)
+        if refresh:
+            self._cache.invalidate(key)
+        return await self._cached(
+            key,
+            lambda: self._single_flight(
+                key,
+                lambda: self.client.get_zone_config(
+                    self._ip_address, self._username, self._password, zone_id
+                ),
+            ),
         )
 
     async def set_zone_input(self, zone_id: str, input):
         """Set zone inputs"""
-        return await self.client.set_zone_input(
+        result = await self.client.set_zone_input(
             self._ip_address, self._username, self._password, zone_id, input
         )
+        self._cache.invalidate(("zone_config", zone_id))
+        self._commanded.setdefault(zone_id, {})["input"] = input
+        return result
     
     async def set_zone_volume(self,zone_id: str, volume: int):
         """Set zone volume"""
-        return await self.client.set_zone_volume(
+        result = await self.client.set_zone_volume(
             self._ip_address, self._username, self._password, zone_id, volume
         )
+        self._cache.invalidate(("zone_config", zone_id))
+        self._commanded.setdefault(zone_id, {})["volume"] = volume
+        return result
+
+    async def _batch(self, commands):
+        """Send commands concurrently, raising the first error once all are done"""
+        results = await asyncio.gather(*commands, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    async def set_zones_input(self, zone_ids: list[str], input):
+        """Set the input of several zones in one batch"""
+        return await self._batch(self.set_zone_input(zone_id, input) for zone_id in zone_ids)
+
+    async def set_zones_volume(self, zone_ids: list[str], volume: int):
+        """Set the volume of several zones in one batch"""
+        return await self._batch(self.set_zone_volume(zone_id, volume) for zone_id in zone_ids)
 
     async def _get_input_ids(self):
         """Get inputs"""
-        inputs = await self.client.get_inputs(self._ip_address, self._username, self._password)
+        inputs = await self._cached(
+            ("input_ids",),
+            lambda: self.client.get_inputs(self._ip_address, self._username, self._password),
+        )
         return inputs["input_ids"]
     
     async def _get_input_info(self):
         """Get inputs"""
-        inputs = await self.client.get_inputs_info(self._ip_address, self._username, self._password)
-        return inputs
+        return await self._single_flight(
+            ("inputs_info",),
+            lambda: self.client.get_inputs_info(self._ip_address, self._username, self._password),
+        )
+
+    async def _get_cached_input_info(self):
+        """Get inputs info, read again only when the cached copy is gone"""
+        return await self._cached(("inputs_info",), self._get_input_info)
 
     async def _get_input_config(self, input_id: str):
         """Get input config"""
-        return await self.client.get_input_config(
-            self._ip_address, self._username, self._password, input_id
+        key = ("input_config", input_id)
+        return await self._cached(
+            key,
+            lambda: self._single_flight(
+                key,
+                lambda: self.client.get_input_config(
+                    self._ip_address, self._username, self._password, input_id
+                ),
+            ),
         )
 
     async def _get_available_inputs(self, input_id: str):
         """Get available inputs"""
-        return await self.client.get_available_inputs(
-            self._ip_address, self._username, self._password, input_id
+        return await self._cached(
+            ("available_inputs", input_id),
+            lambda: self.client.get_available_inputs(
+                self._ip_address, self._username, self._password, input_id
+            ),
         )
-    
+
+    def _invalidate_input(self, input_id: str) -> None:
+        """Drop cached reads for an input after it changed"""
+        self._cache.invalidate(
+            ("input_config", input_id), ("available_inputs", input_id), ("inputs_info",)
+        )
+
     async def set_input_type(self, input_id: str, type: str):
         """Set input type"""
-        return await self.client.set_input_type(
+        result = await self.client.set_input_type(
             self._ip_address, self._username, self._password, input_id, type
         )
+        self._invalidate_input(input_id)
+        return result
 
     async def set_input_volume(self, input_id: str, volume: int):
         """Set the volume for a specific input (0-100)."""
-        return await self.client.set_input_volume(
+        result = await self.client.set_input_volume(
             self._ip_address, self._username, self._password, input_id, volume
         )
+        self._invalidate_input(input_id)
+        return result
 
     async def set_input_enabled(self, input_id: str, enabled: bool):
         """Enable or disable a specific input."""
-        return await self.client.enable_input(
+        result = await self.client.enable_input(
             self._ip_address, self._username, self._password, input_id, enabled
-        )   
+        )
+        self._invalidate_input(input_id)
+        return result
 
-    async def fetch_data(self):
+    async def fetch_data(self, zone_ids: set[str] | None = None, inputs: bool = True):
+        """Poll the amp.
+
+        Only the zones in zone_ids are read, all of them when None, and
+        inputs are skipped when no entity needs them.
+        """
         if self.client is None:
             can_connect = await self.verify_connection()
             if not can_connect:
                 LOGGER.error("Could not connect to Juke Audio")
                 return
+            if self._server_device_id is None:
+                await self.initialize()
 
-        return await self._fetch_data_v3()
+        return await self._fetch_data_v3(zone_ids, inputs)
 
-    async def _fetch_data_v3(self):
-        """Get the data from Juke"""
-        devices = await self._get_devices_info()
-        LOGGER.debug("Juke devices info: %s", devices)
+    def _topology_due(self) -> bool:
+        """Return True when the device topology has to be read again"""
+        return (
+            self._topology_synced is None
+            or time.monotonic() - self._topology_synced > TOPOLOGY_REFRESH_INTERVAL
+        )
 
+    def _sync_topology(self, devices: list[dict]) -> list[str]:
+        """Apply the device list, config and attributes; return rebooted devices"""
+        # Zones and inputs may have changed along with the topology
+        self._cache.invalidate(("zone_ids",), ("input_ids",), ("inputs_info",))
+
+        rebooted = []
         for device in devices:
             if self.jukes.get(device["device_id"]) is None:
                 self.jukes[device["device_id"]] = JukeAudioDevice(self)
                 LOGGER.debug("Initialized JukeAudioDevice for %s", device["device_id"])
             
-            self.jukes[device["device_id"]].update(device)
+            if self.jukes[device["device_id"]].update(device):
+                rebooted.append(device["device_id"])
 
-        zones = await self._get_zones_info()
-        LOGGER.debug("Juke zone info: %s", zones)
+        # Amps that left keep their device, so their entities carry on when
+        # they return; removing the device in HA forgets them
+        device_ids = {device["device_id"] for device in devices}
+        for device_id, juke in self.jukes.items():
+            if device_id not in device_ids and juke.available:
+                LOGGER.debug("Juke device %s is no longer reported", device_id)
+                juke.available = False
 
-        for z in zones:
-            zone_id_parts = z["zone_id"].split("-")
-            zone_device_id = zone_id_parts[0]+"-"+zone_id_parts[1]
-            if self.jukes.get(zone_device_id) is not None:
-                juke = self.jukes[zone_device_id]
-                juke.zones[z["zone_id"]] = z
+        self._topology_synced = time.monotonic()
+        return rebooted
 
-        inputs = await self._get_input_info()
+    def remove_device(self, device_id: str) -> None:
+        """Forget an amp and everything kept for it"""
+        LOGGER.debug("Removing JukeAudioDevice for %s", device_id)
+        self.jukes.pop(device_id, None)
+        self._zone_ids = {z for z in self._zone_ids if device_id_of(z) != device_id}
+        self._input_ids = {i for i in self._input_ids if device_id_of(i) != device_id}
+        self._commanded = {
+            z: state for z, state in self._commanded.items() if device_id_of(z) != device_id
+        }
+
+    def _available_jukes(self) -> dict:
+        """Return the amps reported by the last poll"""
+        return {device_id: juke for device_id, juke in self.jukes.items() if juke.available}
+
+    def _sync_state(self, devices: list[dict]) -> list[str]:
+        """Apply only the live state of each device; return rebooted devices"""
+        return [
+            device["device_id"]
+            for device in devices
+            if self.jukes[device["device_id"]].update_state(device)
+        ]
+
+    async def _restore_commanded(self, device_ids: list[str]) -> None:
+        """Re-apply the last commanded zone sources and volumes in one batch"""
+        commands = []
+        for zone_id, state in self._commanded.items():
+            if device_id_of(zone_id) not in device_ids:
+                continue
+            if "input" in state:
+                commands.append(self.set_zone_input(zone_id, state["input"]))
+            if "volume" in state:
+                commands.append(self.set_zone_volume(zone_id, state["volume"]))
+        if not commands:
+            return
+
+        LOGGER.info("Restoring %d zone settings after Juke reboot", len(commands))
+        for result in await asyncio.gather(*commands, return_exceptions=True):
+            if isinstance(result, Exception):
+                LOGGER.warning("Could not restore Juke zone setting: %s", result)
+
+    async def _fetch_data_v3(self, zone_ids: set[str] | None, include_inputs: bool):
+        """Get the data from Juke
+
+        The full devices info is downloaded on every poll; skipping the
+        topology only saves processing its config and attributes and
+        invalidating the cached ID lists, not network traffic.
+        """
+        devices = await self._get_devices_info()
+        LOGGER.debug("Juke devices info: %s", devices)
+
+        synced = (
+            self._topology_due()
+            or {device["device_id"] for device in devices} != self._available_jukes().keys()
+        )
+        if synced:
+            rebooted = self._sync_topology(devices)
+        else:
+            rebooted = self._sync_state(devices)
+            if rebooted:
+                # A rebooted amp may come back with a different configuration
+                self._sync_topology(devices)
+                synced = True
+
+        if await self._read_zones_and_inputs(zone_ids, include_inputs) and not synced:
+            # The zones and inputs just read are complete; only the device
+            # config and attributes may be stale
+            LOGGER.debug("New Juke zones or inputs, reading topology again")
+            self._sync_topology(devices)
+
+        # Once per poll, however often the state was applied above
+        for juke in self._available_jukes().values():
+            juke.record_statistics()
+
+        if rebooted and self._restore_after_reboot:
+            await self._restore_commanded(rebooted)
+
+    async def _read_zones_and_inputs(self, zone_ids: set[str] | None, include_inputs: bool) -> bool:
+        """Read zone and input state; return True when an unknown ID showed up
+
+        The new state is only applied once every read succeeded, so a failed
+        read leaves the last complete state in place. Amps that are gone
+        keep their last state too.
+        """
+        jukes = self._available_jukes()
+        if zone_ids is not None:
+            zone_ids = {z for z in zone_ids if device_id_of(z) in jukes}
+
+        zones = None
+        if zone_ids is not None and not zone_ids:
+            zones = []
+        elif zone_ids is not None and len(zone_ids) <= PER_ZONE_READ_LIMIT and self._per_zone_reads:
+            zones = await self._read_zone_configs(zone_ids)
+        if zones is None:
+            zones = await self._get_zones_info()
+        LOGGER.debug("Juke zone info: %s", zones)
+
+        if include_inputs:
+            inputs = await self._get_input_info()
+        else:
+            # Zones only need input names and classes, which rarely change
+            inputs = await self._get_cached_input_info()
         LOGGER.debug("Juke input info: %s", inputs)
 
+        device_zones = {device_id: {} for device_id in jukes}
+        device_inputs = {device_id: {} for device_id in jukes}
+        unknown = False
+        for z in zones:
+            if zone_ids is not None and z["zone_id"] not in zone_ids:
+                continue
+            if z["zone_id"] not in self._zone_ids:
+                unknown = True
+            if (juke_zones := device_zones.get(device_id_of(z["zone_id"]))) is not None:
+                juke_zones[z["zone_id"]] = z
         for i in inputs:
-            input_id_parts = i["input_id"].split("-")
-            input_device_id = input_id_parts[0]+"-"+input_id_parts[1]
-            if self.jukes.get(input_device_id) is not None:
-                juke = self.jukes[input_device_id]
-                juke.inputs[i["input_id"]] = i
+            if i["input_id"] not in self._input_ids:
+                unknown = True
+            if (juke_inputs := device_inputs.get(device_id_of(i["input_id"]))) is not None:
+                juke_inputs[i["input_id"]] = i
+
+        for device_id, juke in jukes.items():
+            juke.zones = device_zones[device_id]
+            juke.inputs = device_inputs[device_id]
+            for zone in juke.zones.values():
+                juke.group.update(zone)
+            for zone_id in juke.group.zone_ids:
+                if zone_id not in juke.zones and (zone_ids is None or zone_id in zone_ids):
+                    juke.group.remove(zone_id)
+            self._zone_ids.update(juke.zones)
+            self._input_ids.update(juke.inputs)
+        return unknown
+
+    async def _read_zone_configs(self, zone_ids: set[str]) -> list[dict] | None:
+        """Read zones one by one; return None when their config lacks zone state"""
+        zone_ids = list(zone_ids)
+        configs = await asyncio.gather(
+            *(self._get_zone_config(zone_id, refresh=True) for zone_id in zone_ids)
+        )
+        zones = [zone_from_config(zone_id, config) for zone_id, config in zip(zone_ids, configs)]
+        if None in zones:
+            LOGGER.debug("Juke zone config lacks zone state, reading zones info instead: %s", configs)
+            self._per_zone_reads = False
+            return None
+        return zones
+
+    async def get_raw_data(self):
+        """Get the full poll payloads for diagnostics"""
+        return {
+            "devices": await self._get_devices_info(),
+            "zones": await self._get_zones_info(),
+            "inputs": await self._get_input_info(),
+        }
+
+class JukeAudioSite:
+    """Hub for a site with several independent Juke servers
+
+    Each server keeps its own JukeAudioHub, so commands from a device are
+    routed to the server that owns it. Polling runs concurrently under a
+    shared limit and the devices of all servers are merged into jukes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ip_addresses: list[str],
+        username: str,
+        password: str,
+        restore_after_reboot: bool = False,
+    ) -> None:
+        self._hass = hass
+        self.hubs = [
+            JukeAudioHub(hass, ip_address, username, password, restore_after_reboot)
+            for ip_address in ip_addresses
+        ]
+        self.jukes = {}
+        self._semaphore = asyncio.Semaphore(MULTI_SERVER_CONCURRENCY)
+
+    async def _gather(self, action):
+        """Run action for every hub under the concurrency limit"""
+
+        async def run(hub: JukeAudioHub):
+            async with self._semaphore:
+                return await action(hub)
+
+        return await asyncio.gather(
+            *(run(hub) for hub in self.hubs), return_exceptions=True
+        )
+
+    async def verify_connection(self) -> bool:
+        """Test if we can connect to at least one of the hosts."""
+        results = await self._gather(lambda hub: hub.verify_connection())
+        for hub, result in zip(self.hubs, results):
+            if result is not True:
+                LOGGER.warning("Could not connect to Juke server %s", hub.host)
+        return any(result is True for result in results)
+
+    def _connected_hub(self) -> JukeAudioHub:
+        """Return the first server that is connected and initialized"""
+        for hub in self.hubs:
+            if hub.client is not None and hub.server_device_id is not None:
+                return hub
+        raise UnexpectedException(
+            f"None of the Juke servers {', '.join(hub.host for hub in self.hubs)} is connected"
+        )
+
+    async def get_devices(self):
+        """Get device list of the first connected server"""
+        return await self._connected_hub().get_devices()
+
+    async def initialize(self):
+        """Initialize hubs that are connected"""
+        results = await self._gather(
+            lambda hub: hub.initialize() if hub.client is not None else asyncio.sleep(0)
+        )
+        for hub, result in zip(self.hubs, results):
+            if isinstance(result, Exception):
+                LOGGER.warning("Could not initialize Juke server %s: %s", hub.host, result)
+
+    def start_recording(self, recorder: CaptureWriter) -> None:
+        """Record the client calls of all servers to recorder"""
+        for hub in self.hubs:
+            hub.start_recording(recorder)
+
+    def stop_recording(self) -> None:
+        """Stop recording client calls"""
+        for hub in self.hubs:
+            hub.stop_recording()
+
+    @property
+    def server_device_id(self) -> str | None:
+        """Device ID of the first connected server"""
+        return next(
+            (hub.server_device_id for hub in self.hubs if hub.server_device_id is not None), None
+        )
+
+    async def get_connection_info(self):
+        """Get connection info of the first connected server"""
+        return await self._connected_hub().get_connection_info()
+
+    def remove_device(self, device_id: str) -> None:
+        """Forget an amp on whichever server reported it"""
+        for hub in self.hubs:
+            hub.remove_device(device_id)
+        self.jukes.pop(device_id, None)
+
+    async def get_raw_data(self):
+        """Get the full poll payloads of every server for diagnostics"""
+        results = await self._gather(lambda hub: hub.get_raw_data())
+        return {
+            hub.host: repr(result) if isinstance(result, Exception) else result
+            for hub, result in zip(self.hubs, results)
+        }
+
+    async def fetch_data(self, zone_ids: set[str] | None = None, inputs: bool = True):
+        """Poll all servers, marking the amps of failed ones unavailable"""
+        results = await self._gather(lambda hub: hub.fetch_data(zone_ids, inputs))
+
+        errors = []
+        jukes = {}
+        for hub, result in zip(self.hubs, results):
+            if isinstance(result, Exception):
+                LOGGER.warning("Error polling Juke server %s: %s", hub.host, result)
+                errors.append(result)
+                for juke in hub.jukes.values():
+                    juke.available = False
+            jukes.update(hub.jukes)
+        self.jukes = jukes
+
+        if len(errors) == len(self.hubs):
+            raise errors[0]
+
 
 class JukeAudioDevice:
     """HA device for Juke Audio"""
 
-    def update(self, device_info) -> None:
-        """Update device information"""
+    def update(self, device_info) -> bool:
+        """Update device topology and state, returning True after a reboot"""
         self._device_id = device_info["device_id"]
-        self.config = device_info["config"]
+        self.config = project(device_info["config"], DEVICE_CONFIG_FIELDS)
+        rebooted = self.update_state(device_info)
+        self.device_attributes = project(device_info["attributes"], DEVICE_ATTRIBUTES_FIELDS)
+        self.uid_base = self.device_attributes["serial_number"]
+        return rebooted
+
+    def update_state(self, device_info) -> bool:
+        """Update connection state and metrics, returning True after a reboot"""
+        uptime = (device_info.get("connection") or {}).get("uptime")
+        firmware = (device_info.get("attributes") or {}).get("firmware_version")
+        rebooted = uptime is not None and self._uptime is not None and uptime < self._uptime
+        if rebooted:
+            LOGGER.debug("Juke device %s rebooted", self._device_id)
+        elif self._firmware is not None and firmware != self._firmware:
+            LOGGER.debug("Juke device %s firmware changed", self._device_id)
+            rebooted = True
+        if rebooted:
+            self.hub.invalidate_cache()
+        self._uptime = uptime
+        self._firmware = firmware
+        self.available = True
+
         self.connection_info = device_info["connection"]
         self.device_metrics = device_info["metrics"]
-        self.device_attributes = device_info["attributes"]
-        self.uid_base = self.device_attributes["serial_number"]
-        self.zones = {}
-        self.inputs = {}
+        return rebooted
 
     def __init__(self, hub: JukeAudioHub) -> None:
         self.hub = hub
+        self._uptime = None
+        self._firmware = None
+        # False while the amp is not reported or its server cannot be polled
+        self.available = True
+        self.device_attributes = None
+        self.zones = {}
+        self.inputs = {}
+        self.group = ZoneGroup()
+        self.statistics = {
+            "cpu_usage": RollingStatistics(ROLLING_WINDOW_SIZE, 0, 100),
+            "ram_usage": RollingStatistics(ROLLING_WINDOW_SIZE, 0, 100),
+            "disk_usage": RollingStatistics(ROLLING_WINDOW_SIZE, 0, 100),
+            "signal_strength": RollingStatistics(ROLLING_WINDOW_SIZE, -120, 0),
+        }
+
+    def record_statistics(self) -> None:
+        """Add the latest metrics to the rolling statistics"""
+        if self.device_metrics is not None:
+            for key in ("cpu_usage", "ram_usage", "disk_usage"):
+                self.statistics[key].add(self.device_metrics.get(key))
+        if self.connection_info is not None:
+            self.statistics["signal_strength"].add(self.connection_info.get("signal_strength"))
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -29,6 +29,12 @@ async def async_setup_entry(
     for juke_id in hub.jukes:
         juke = hub.jukes[juke_id]
 
+        # Add the amp entity controlling all zones together
+        if juke.zones:
+            entities.append(
+                AmpMediaPlayer(juke, coordinator, config_entry)
+            )
+
         # Add zone entities
         for zone_id in juke.zones:
             entities.append(
@@ -63,16 +69,82 @@ class JukeAudioMediaPlayerBase(CoordinatorEntity, MediaPlayerEntity):
     def device_info(self) -> DeviceInfo:
         return self._juke.device_info
 
+    @property
+    def available(self) -> bool:
+        """Unavailable while the amp is not reported or cannot be polled."""
+        return super().available and self._juke.available
+
+    def _subscriptions(self) -> list[tuple[str, str | None]]:
+        """Data this entity needs from each poll"""
+        return []
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the data this entity needs."""
+        await super().async_added_to_hass()
+        for kind, key in self._subscriptions():
+            self.async_on_remove(self.coordinator.async_subscribe(kind, key))
+
     @callback
     def _handle_coordinator_update(self) -> None:
         self.async_write_ha_state()
 
+    async def _async_command(self, command) -> None:
+        """Send a command to the amp and refresh, profiled when requested."""
+        with self.coordinator.profile("command"):
+            await command
+            await self.async_update()
 
-class Zone(JukeAudioMediaPlayerBase):
-    """Zone media player"""
+
+class ZoneMediaPlayerBase(JukeAudioMediaPlayerBase):
+    """Base class for media players that route inputs to zones"""
 
     device_class = MediaPlayerDeviceClass.SPEAKER
 
+    @property
+    def supported_features(self) -> MediaPlayerEntityFeature:
+        """Flag media player features that are supported."""
+        return (
+            MediaPlayerEntityFeature.SELECT_SOURCE
+            | MediaPlayerEntityFeature.VOLUME_SET
+        )
+
+    @property
+    def source_list(self) -> list[str]:
+        """List of available input sources."""
+        sources = ["None"]
+
+        for i in self._juke.inputs:
+            # Only show enabled inputs
+            if (self._juke.inputs[i]["input_class"] == 0 and 
+                self._juke.inputs[i].get("enabled", True)):
+                sources.append(self._juke.inputs[i]["name"])
+
+        return sources
+
+    @property
+    def media_content_type(self):
+        """Content type of current playing media."""
+        return MediaType.MUSIC
+
+    def _source_name(self, zone_inputs: list[str]) -> str:
+        """Name of the first selectable input routed to a zone"""
+        for input_id in zone_inputs:
+            if input_id in self._juke.inputs and self._juke.inputs[input_id]["input_class"] == 0:
+                return self._juke.inputs[input_id]["name"]
+
+        return "None"
+
+    def _input_id_for(self, source: str) -> str | None:
+        """Input ID of a source name from source_list"""
+        for i in self._juke.inputs:
+            if self._juke.inputs[i]["name"] == source:
+                return self._juke.inputs[i]["input_id"]
+        return None
+
+
+class Zone(ZoneMediaPlayerBase):
+    """Zone media player"""
+
     def __init__(self, juke: JukeAudioDevice, coordinator, config_entry, zone_id) -> None:
         """Initialize the sensor."""
         super().__init__(juke, coordinator, config_entry)
@@ -82,9 +154,19 @@ class Zone(JukeAudioMediaPlayerBase):
     def unique_id(self) -> str:
         return f"zone_{self._zone_id}"
 
+    def _subscriptions(self) -> list[tuple[str, str | None]]:
+        # Source names come from the cached inputs listing, not the inputs poll
+        return [("zone", self._zone_id)]
+
+    @property
+    def available(self) -> bool:
+        """Unavailable while the amp does not report the zone."""
+        return super().available and self._zone_id in self._juke.zones
+
     @property
     def name(self) -> str:
-        return f'{self._juke.zones[self._zone_id]["name"]} Zone'
+        zone_data = self._juke.zones.get(self._zone_id, {})
+        return f'{zone_data.get("name", self._zone_id)} Zone'
 
     @property
     def extra_state_attributes(self):
@@ -165,66 +247,92 @@ class Zone(JukeAudioMediaPlayerBase):
         else:
             return "mdi:speaker-off"
 
-    @property
-    def supported_features(self) -> MediaPlayerEntityFeature:
-        """Flag media player features that are supported."""
-        return (
-            MediaPlayerEntityFeature.SELECT_SOURCE
-            | MediaPlayerEntityFeature.VOLUME_SET
-        )
-
     @property
     def volume_level(self) -> float | None:
         """Volume level of the media player (0..1)."""
         return float(self._juke.zones[self._zone_id]["volume"]) / 100.0
 
     @property
-    def source_list(self) -> list[str]:
-        """List of available input sources."""
-        sources = ["None"]
+    def source(self) -> str:
+        """Currently selected input source"""
+        return self._source_name(self._juke.zones[self._zone_id]["input"])
 
-        for i in self._juke.inputs:
-            # Only show enabled inputs
-            if (self._juke.inputs[i]["input_class"] == 0 and 
-                self._juke.inputs[i].get("enabled", True)):
-                sources.append(self._juke.inputs[i]["name"])
+    async def async_set_volume_level(self, volume):
+        """Set volume level, range 0..1."""
+        LOGGER.debug("Setting volume to %s for zone %s", volume, self._zone_id)
+        await self._async_command(self._juke.hub.set_zone_volume(self._zone_id, int(volume*100)))
 
-        return sources
+    async def async_select_source(self, source: str):
+        """Select input source."""
+        input_id = self._input_id_for(source)
+        LOGGER.debug("Setting input to %s for zone %s", input_id, self._zone_id)
+        await self._async_command(self._juke.hub.set_zone_input(self._zone_id, input_id))
+
+
+class AmpMediaPlayer(ZoneMediaPlayerBase):
+    """Media player for all zones of an amp"""
+
+    # The group needs every zone, which turns off per-zone polling, so it
+    # is only polled for when enabled
+    _attr_entity_registry_enabled_default = False
 
     @property
-    def source(self) -> str:
-        """Currently selected input source"""
-        zone_inputs = self._juke.zones[self._zone_id]["input"]
+    def unique_id(self) -> str:
+        return f"{self._juke.uid_base}_all_zones"
 
-        for input_id in zone_inputs:
-            if input_id in self._juke.inputs and self._juke.inputs[input_id]["input_class"] == 0:
-                return self._juke.inputs[input_id]["name"]
+    def _subscriptions(self) -> list[tuple[str, str | None]]:
+        return [("zone", zone_id) for zone_id in self._juke.zones]
 
-        return "None"
+    @property
+    def name(self) -> str:
+        return "All Zones"
 
     @property
-    def media_content_type(self):
-        """Content type of current playing media."""
-        return MediaType.MUSIC
+    def state(self) -> MediaPlayerState | None:
+        """Playing when any zone plays, on when any zone is enabled."""
+        group = self._juke.group
+        if group.playing:
+            return MediaPlayerState.PLAYING
+        if group.enabled:
+            return MediaPlayerState.ON
+        return MediaPlayerState.OFF
 
-    async def async_set_volume_level(self, volume):
-        """Set volume level, range 0..1."""
-        LOGGER.debug("Setting volume to %s for zone %s", volume, self._zone_id)
-        await self._juke.hub.set_zone_volume(self._zone_id, int(volume*100))
-        await self.async_update()
+    @property
+    def icon(self) -> str | None:
+        if self.state == MediaPlayerState.OFF:
+            return "mdi:speaker-off"
+        return "mdi:speaker-multiple"
 
-    async def async_select_source(self, source: str):
-        """Select input source."""
+    @property
+    def volume_level(self) -> float | None:
+        """Mean volume of the zones (0..1)."""
+        volume = self._juke.group.volume
+        if volume is None:
+            return None
+        return volume / 100.0
 
-        input_id = None
-        for i in self._juke.inputs:
-            if self._juke.inputs[i]["name"] == source:
-                input_id = self._juke.inputs[i]["input_id"]
-                break
+    @property
+    def source(self) -> str | None:
+        """Input source shared by all zones, None when they differ"""
+        zone_inputs = self._juke.group.source
+        if zone_inputs is None:
+            return None
+        return self._source_name(zone_inputs)
 
-        LOGGER.debug("Setting input to %s for zone %s", input_id, self._zone_id)
-        await self._juke.hub.set_zone_input(self._zone_id, input_id)
-        await self.async_update()
+    async def async_set_volume_level(self, volume):
+        """Set volume level of all zones, range 0..1."""
+        LOGGER.debug("Setting volume to %s for all zones of %s", volume, self._juke.uid_base)
+        await self._async_command(
+            self._juke.hub.set_zones_volume(self._juke.group.zone_ids, int(volume*100))
+        )
+
+    async def async_select_source(self, source: str):
+        """Select input source for all zones."""
+        input_id = self._input_id_for(source)
+        LOGGER.debug("Setting input to %s for all zones of %s", input_id, self._juke.uid_base)
+        await self._async_command(
+            self._juke.hub.set_zones_input(self._juke.group.zone_ids, input_id)
+        )
 
 
 class InputMediaPlayer(JukeAudioMediaPlayerBase):
@@ -240,10 +348,19 @@ class InputMediaPlayer(JukeAudioMediaPlayerBase):
     @property
     def unique_id(self) -> str:
         return f"input_{self._input_id}"
+
+    def _subscriptions(self) -> list[tuple[str, str | None]]:
+        return [("inputs", None)]
+
+    @property
+    def available(self) -> bool:
+        """Unavailable while the amp does not report the input."""
+        return super().available and self._input_id in self._juke.inputs
     
     @property
     def name(self) -> str:
-        return f"{self._juke.inputs[self._input_id]['name']} Input"
+        input_data = self._juke.inputs.get(self._input_id, {})
+        return f"{input_data.get('name', self._input_id)} Input"
     
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
@@ -251,7 +368,7 @@ class InputMediaPlayer(JukeAudioMediaPlayerBase):
         features = MediaPlayerEntityFeature.SELECT_SOURCE | MediaPlayerEntityFeature.TURN_ON | MediaPlayerEntityFeature.TURN_OFF
         
         # Only add volume control if volume exists for this input
-        input_data = self._juke.inputs[self._input_id]
+        input_data = self._juke.inputs.get(self._input_id, {})
         if "volume" in input_data and input_data["volume"] is not None:
             features |= MediaPlayerEntityFeature.VOLUME_SET
             
@@ -283,6 +400,9 @@ class InputMediaPlayer(JukeAudioMediaPlayerBase):
     @property
     def source_list(self) -> list[str]:
         """List of available input types."""
+        # Source lists are written even while the entity is unavailable
+        if self._input_id not in self._juke.inputs:
+            return []
         available_types = self._juke.inputs[self._input_id]["available_types"]
         
         # Get current source by using the source property
@@ -317,23 +437,19 @@ class InputMediaPlayer(JukeAudioMediaPlayerBase):
     async def async_set_volume_level(self, volume):
         """Set volume level, range 0..1."""
         LOGGER.debug("Setting volume to %s for input %s", volume, self._input_id)
-        await self._juke.hub.set_input_volume(self._input_id, int(volume*100))
-        await self.async_update()
+        await self._async_command(self._juke.hub.set_input_volume(self._input_id, int(volume*100)))
     
     async def async_select_source(self, source: str):
         """Select input type."""
         LOGGER.debug("Setting input type to %s for input %s", source, self._input_id)
-        await self._juke.hub.set_input_type(self._input_id, source)
-        await self.async_update()
+        await self._async_command(self._juke.hub.set_input_type(self._input_id, source))
     
     async def async_turn_on(self) -> None:
         """Turn the input on (enable it)."""
         LOGGER.debug("Enabling input %s", self._input_id)
-        await self._juke.hub.set_input_enabled(self._input_id, True)
-        await self.async_update()
+        await self._async_command(self._juke.hub.set_input_enabled(self._input_id, True))
     
     async def async_turn_off(self) -> None:
         """Turn the input off (disable it)."""
         LOGGER.debug("Disabling input %s", self._input_id)
-        await self._juke.hub.set_input_enabled(self._input_id, False)
-        await self.async_update()
+        await self._async_command(self._juke.hub.set_input_enabled(self._input_id, False))
@@ -0,0 +1,40 @@
+"""Projection of Juke Audio device payloads onto the fields the integration keeps"""
+from __future__ import annotations
+
+# Fields of the device config and attributes read by the entities. Both are
+# kept from one topology sync to the next, so everything else is dropped;
+# live state is stored as the client decoded it.
+DEVICE_CONFIG_FIELDS = ("name",)
+DEVICE_ATTRIBUTES_FIELDS = ("device_id", "serial_number", "firmware_version")
+
+# Fields of a zones info entry read by the entities, and the ones without
+# which a zone's state cannot be shown
+ZONE_FIELDS = ("name", "volume", "input", "active_input", "enabled", "warnings")
+ZONE_REQUIRED_FIELDS = ("name", "volume", "input", "active_input")
+
+
+def project(payload: dict | None, fields: tuple[str, ...]) -> dict | None:
+    """Return a dict holding only the given fields of payload"""
+    if payload is None:
+        return None
+    return {field: payload[field] for field in fields if field in payload}
+
+
+def zone_from_config(zone_id: str, config) -> dict | None:
+    """Map a zone config response onto the fields of a zones info entry
+
+    Returns None when the response lacks a field the entities need.
+    """
+    if not isinstance(config, dict) or any(field not in config for field in ZONE_REQUIRED_FIELDS):
+        return None
+    zone = {"zone_id": zone_id}
+    for field in ZONE_FIELDS:
+        if field in config:
+            zone[field] = config[field]
+    return zone
+
+
+def device_id_of(entity_id: str) -> str:
+    """Return the device ID a zone or input ID belongs to"""
+    parts = entity_id.split("-", 2)
+    return parts[0] + "-" + parts[1]
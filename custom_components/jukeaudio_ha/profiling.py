@@ -0,0 +1,131 @@
+"""On-demand profiling of the Juke Audio poll and command paths"""
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import time
+
+from collections.abc import Callable
+from contextlib import contextmanager
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER, PROFILE_REPORT_LINES, PROFILE_TIMEOUT
+
+
+class JukeProfiler:
+    """Profiles the next refreshes of the coordinators and the commands in between
+
+    One profiler is shared by all entries, since only one profiler can be
+    active in the interpreter. It switches itself off after the requested
+    number of refreshes, or after PROFILE_TIMEOUT seconds, and writes a
+    report to the config directory.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, name: str, refreshes: int, on_done: Callable[[], None]
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._refreshes = refreshes
+        self._on_done = on_done
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._durations: dict[str, list[float]] = {"refresh": [], "command": []}
+        self._finished = False
+        self._expired = False
+        self._cancel_timeout = async_call_later(hass, PROFILE_TIMEOUT, self._async_timeout)
+
+    @contextmanager
+    def section(self, kind: str):
+        """Profile the enclosed code as a refresh or command
+
+        The enclosed code always runs, also when profiling cannot start.
+        """
+        if self._finished:
+            yield
+            return
+        if self._depth == 0:
+            try:
+                self._profile.enable()
+            except ValueError as exc:
+                # Another profiler, such as the profiler integration, is active
+                LOGGER.warning("Juke profiling for %s stopped: %s", self._name, exc)
+                self._finish()
+                yield
+                return
+        started = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self._durations[kind].append(time.perf_counter() - started)
+            if self._depth == 0:
+                self._profile.disable()
+                if self._expired or len(self._durations["refresh"]) >= self._refreshes:
+                    self._finish()
+
+    @callback
+    def _async_timeout(self, _now) -> None:
+        """Stop profiling when not enough refreshes happened in time"""
+        self._cancel_timeout = None
+        self._expired = True
+        if self._depth == 0:
+            self._finish()
+
+    def _finish(self) -> None:
+        """Switch off and write the report"""
+        if self._finished:
+            return
+        self._finished = True
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+        self._on_done()
+        if not any(self._durations.values()):
+            LOGGER.info("Juke profiling for %s ended before anything was profiled", self._name)
+            return
+        self._hass.async_create_task(self._async_write_report())
+
+    def _summary(self) -> str:
+        """Short summary of the profiled sections"""
+        lines = []
+        for kind, durations in self._durations.items():
+            if durations:
+                lines.append(
+                    f"{len(durations)} {kind}(s): mean {sum(durations) / len(durations) * 1000:.1f} ms, "
+                    f"max {max(durations) * 1000:.1f} ms"
+                )
+        return "\n".join(lines)
+
+    async def _async_write_report(self) -> None:
+        """Write the profile to the config directory and notify"""
+        timestamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+        path = self._hass.config.path(f"jukeaudio_profile_{self._name}_{timestamp}")
+        summary = self._summary()
+        await self._hass.async_add_executor_job(self._write_report, path, summary)
+        LOGGER.info("Juke profile for %s written to %s.txt", self._name, path)
+
+        persistent_notification.async_create(
+            self._hass,
+            f"{summary}\n\nReport: `{path}.txt`\nProfile: `{path}.prof`",
+            title=f"Juke Audio profile: {self._name}",
+            notification_id=f"jukeaudio_profile_{self._name}",
+        )
+
+    def _write_report(self, path: str, summary: str) -> None:
+        """Write the text report and raw profile"""
+        self._profile.dump_stats(f"{path}.prof")
+        output = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_REPORT_LINES)
+        with open(f"{path}.txt", "w", encoding="utf-8") as file:
+            file.write(f"{summary}\n\n")
+            file.write(
+                "Other event loop tasks running during a profiled section are included.\n\n"
+            )
+            file.write(output.getvalue())
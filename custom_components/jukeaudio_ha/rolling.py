@@ -0,0 +1,102 @@
+"""Rolling statistics for Juke Audio health metrics"""
+from __future__ import annotations
+
+import math
+
+from collections import deque
+
+
+class RollingStatistics:
+    """Fixed-size window of samples with O(1) min, mean, max and percentiles.
+
+    Samples are bucketed into a histogram of whole units between lower and
+    upper, so memory stays bounded by the window size and the value range.
+    """
+
+    def __init__(self, size: int, lower: int, upper: int) -> None:
+        self._size = size
+        self._lower = lower
+        self._upper = upper
+        self._samples: deque[tuple[int, float]] = deque()
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+        self._histogram = [0] * (upper - lower + 1)
+        self._sum = 0.0
+        self._index = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def _bucket(self, value: float) -> int:
+        """Return the histogram bucket for a value"""
+        return min(max(int(round(value)), self._lower), self._upper) - self._lower
+
+    def add(self, value) -> None:
+        """Add a sample, evicting the oldest one when the window is full"""
+        if value is None:
+            return
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return
+
+        if len(self._samples) == self._size:
+            index, old = self._samples.popleft()
+            self._sum -= old
+            self._histogram[self._bucket(old)] -= 1
+            if self._min[0][0] == index:
+                self._min.popleft()
+            if self._max[0][0] == index:
+                self._max.popleft()
+
+        sample = (self._index, value)
+        self._index += 1
+        self._samples.append(sample)
+        self._sum += value
+        self._histogram[self._bucket(value)] += 1
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append(sample)
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append(sample)
+
+    @property
+    def minimum(self) -> float | None:
+        """Smallest sample in the window"""
+        return self._min[0][1] if self._min else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Largest sample in the window"""
+        return self._max[0][1] if self._max else None
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the samples in the window"""
+        if not self._samples:
+            return None
+        return round(self._sum / len(self._samples), 2)
+
+    def percentile(self, percent: float) -> int | None:
+        """Return the given percentile, rounded to whole units"""
+        if not self._samples:
+            return None
+        rank = max(1, math.ceil(len(self._samples) * percent / 100))
+        seen = 0
+        for bucket, count in enumerate(self._histogram):
+            seen += count
+            if seen >= rank:
+                return bucket + self._lower
+        return self._upper
+
+    def as_dict(self) -> dict:
+        """Return the statistics as entity attributes"""
+        return {
+            "rolling_min": self.minimum,
+            "rolling_mean": self.mean,
+            "rolling_max": self.maximum,
+            "rolling_p95": self.percentile(95),
+            "rolling_samples": len(self._samples),
+        }
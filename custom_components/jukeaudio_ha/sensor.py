@@ -49,6 +49,11 @@ class JukeAudioSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for our sensors"""
 
     _attr_has_entity_name = True
+    _statistics_key: str | None = None
+    # Rolling statistics change on every poll; keep them out of the recorder
+    _unrecorded_attributes = frozenset(
+        {"rolling_min", "rolling_mean", "rolling_max", "rolling_p95", "rolling_samples"}
+    )
 
     def __init__(self, juke: JukeAudioDevice, coordinator, config_entry) -> None:
         """Initialize the sensor."""
@@ -62,6 +67,19 @@ class JukeAudioSensorBase(CoordinatorEntity, SensorEntity):
     def device_info(self) -> DeviceInfo:
         return self._juke.device_info
 
+    @property
+    def available(self) -> bool:
+        """Unavailable while the amp is not reported or cannot be polled."""
+        return super().available and self._juke.available
+
+    @property
+    def extra_state_attributes(self):
+        """Return rolling statistics for the metric, if tracked."""
+        statistics = self._juke.statistics.get(self._statistics_key)
+        if statistics is None or len(statistics) == 0:
+            return None
+        return statistics.as_dict()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         self.async_write_ha_state()
@@ -70,6 +88,7 @@ class JukeAudioSensorBase(CoordinatorEntity, SensorEntity):
 class SignalStrength(JukeAudioSensorBase):
     """Signal Strenth sensor"""
 
+    _statistics_key = "signal_strength"
     device_class = SensorDeviceClass.SIGNAL_STRENGTH
     state_class = SensorStateClass.MEASUREMENT
     native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
@@ -158,6 +177,7 @@ class Uptime(JukeAudioSensorBase):
 class CpuUsage(JukeAudioSensorBase):
     """CPU Usage sensor"""
 
+    _statistics_key = "cpu_usage"
     native_unit_of_measurement = PERCENTAGE
     entity_category = EntityCategory.DIAGNOSTIC
 
@@ -179,6 +199,7 @@ class CpuUsage(JukeAudioSensorBase):
 class DiskUsage(JukeAudioSensorBase):
     """Disk Usage sensor"""
 
+    _statistics_key = "disk_usage"
     native_unit_of_measurement = PERCENTAGE
     entity_category = EntityCategory.DIAGNOSTIC
 
@@ -200,6 +221,7 @@ class DiskUsage(JukeAudioSensorBase):
 class RamUsage(JukeAudioSensorBase):
     """RAM Usage sensor"""
 
+    _statistics_key = "ram_usage"
     native_unit_of_measurement = PERCENTAGE
     entity_category = EntityCategory.DIAGNOSTIC
 